@@ -1,9 +1,31 @@
+import io
+import os
 import csv
 import sys
+import mmap
+import struct
+import hashlib
 import argparse
+import importlib.util
+from array import array
+from itertools import islice
 from pathlib import Path
 from datetime import datetime
-import difflib
+from typing import Any, BinaryIO
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+# Number of rows fingerprinted (and probed) together in entry mode
+BATCH_SIZE = 65536
+# Largest len(a) * len(b) literal diffed with rapidfuzz's LCS, whose time and memory grow with it
+LCS_DIFF_BUDGET = 20000 * 20000
+
+# .hashidx sidecar header: fingerprint algorithm, CSV parser, CSV mtime (ns), CSV size, row count
+HASH_INDEX_HEADER = struct.Struct('<8s8sQQQ')
+FINGERPRINT_TAG = b'xxh3_v2' if xxhash is not None else b'blk2b_v2'
 
 #################################
 ###      CSV DIFFER TOOL      ###
@@ -21,6 +43,8 @@ def parse_arguments():
       -m, --mode (str, optional): Type of difference report to generate. Choices are 'literal' for line-by-line comparison and 'entry' for entry-wise comparison. Defaults to 'summary'.
       -v, --verbose (bool, optional): Enable verbose output.
       -c, --count (bool, optional): Count the number of differing rows.
+      --hash-index (bool, optional): Cache row fingerprints in a .hashidx file next to each CSV, or in ~/.cache/csv_diff (entry mode).
+      --arrow (bool, optional): Parse CSV files with pyarrow instead of the csv module (entry mode).
 
     Returns:
       argparse.Namespace: Parsed command-line arguments.
@@ -32,6 +56,8 @@ def parse_arguments():
     parser.add_argument("-m", "--mode", choices=["literal", "entry"], default="summary", help="Type of difference report to generate. 'literal' for line-by-line, 'entry' for entry-wise comparison.")
     parser.add_argument("-v", "--verbose", action="store_true", help="Enable verbose output.")
     parser.add_argument("-c", "--count", action="store_true", help="Count the number of differing rows.")
+    parser.add_argument("--hash-index", action="store_true", help="Cache row fingerprints in a .hashidx file next to each CSV (or in ~/.cache/csv_diff if that is not writable) so later entry diffs can skip hashing.")
+    parser.add_argument("--arrow", action="store_true", help="Parse CSV files with pyarrow's multithreaded reader in entry mode. Requires pyarrow and the same number of fields on every row.")
     return parser.parse_args()
 
 
@@ -74,84 +100,568 @@ def get_proper_output_path(base_path):
         return Path.cwd() / base_path
 
 
-def read_csv(file_path):
+class MmapReader(io.RawIOBase):
+    """
+    Read-only raw stream over a memory map, so io.BufferedReader and io.TextIOWrapper can wrap it.
+
+    Args:
+      mm (mmap.mmap): The memory map to read from, starting at its current position.
+    """
+
+    def __init__(self, mm):
+        self.mm = mm
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        data = self.mm.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+
+def iter_csv(file_path):
     """
-    Reads a CSV file and returns its contents as a list of rows.
+    Lazily reads a CSV file, yielding one row at a time.
+
+    The file is memory-mapped so large files are paged in by the kernel, and csv.reader reads it
+    through a newline='' text stream over the mapping, exactly as it would read the file itself.
+    Files without any quote characters skip csv.reader and split each line on commas, straight from
+    the mapping when they don't contain \r either.
 
     Args:
       file_path (str): The path to the CSV file to be read.
 
-    Returns:
-      list: A list of rows, where each row is represented as a list of strings.
+    Yields:
+      list: A row from the CSV file, represented as a list of strings.
 
     Raises:
       FileNotFoundError: If the specified file does not exist.
       UnicodeDecodeError: If the file cannot be decoded using UTF-8 encoding.
     """
+    with open(file_path, 'rb') as csvfile:
+        # mmap cannot map an empty file
+        if os.fstat(csvfile.fileno()).st_size == 0:
+            return
+        with mmap.mmap(csvfile.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            # Without any quote characters a row is just its line split on commas
+            has_quotes = mm.find(b'"') != -1
+            if not has_quotes and mm.find(b'\r') == -1:
+                # Only \n can end a line, so the mapping is split on it directly
+                for line in iter(mm.readline, b''):
+                    line = line.rstrip(b'\n')
+                    yield line.decode('utf-8').split(',') if line else []
+                return
+
+            # newline='' ends lines at \r, \n and \r\n, like csv.reader does
+            lines = io.TextIOWrapper(io.BufferedReader(MmapReader(mm)), encoding='utf-8', newline='')
+            if has_quotes:
+                yield from csv.reader(lines)
+            else:
+                for line in lines:
+                    line = line.rstrip('\r\n')
+                    yield line.split(',') if line else []
+
+
+def iter_csv_arrow(file_path):
+    """
+    Lazily reads a CSV file with pyarrow's multithreaded parser, yielding one row at a time.
+
+    Every column is read as a string so rows match what csv.reader produces. Files with blank lines
+    are read with iter_csv instead. Unlike csv.reader, pyarrow requires every row to have as many
+    fields as the first row.
+
+    Args:
+      file_path (str): The path to the CSV file to be read.
+
+    Yields:
+      list: A row from the CSV file, represented as a list of strings.
+
+    Raises:
+      FileNotFoundError: If the specified file does not exist.
+      pyarrow.ArrowInvalid: If a row has a different number of fields than the first row.
+    """
+    import pyarrow as pa
+    import pyarrow.csv as pac
+
+    # Sniff the column count so every column can be typed as a string up front
     with open(file_path, newline='', encoding='utf-8') as csvfile:
-        return list(csv.reader(csvfile))
+        first_row = next(csv.reader(csvfile), None)
+    if not first_row:
+        yield from iter_csv(file_path)
+        return
+
+    # pyarrow reads a blank line as a row of empty strings where csv.reader gives [], so files
+    # with a blank line anywhere (even inside a quoted value) are read with csv.reader instead
+    with open(file_path, 'rb') as csvfile, mmap.mmap(csvfile.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        has_blank_lines = any(mm.find(newlines) != -1 for newlines in (b'\n\n', b'\r\r', b'\n\r'))
+    if has_blank_lines:
+        yield from iter_csv(file_path)
+        return
+
+    column_names = [f"f{i}" for i in range(len(first_row))]
+    reader = pac.open_csv(
+        file_path,
+        read_options=pac.ReadOptions(column_names=column_names, use_threads=True),
+        parse_options=pac.ParseOptions(newlines_in_values=True, ignore_empty_lines=False),
+        convert_options=pac.ConvertOptions(
+            column_types={name: pa.string() for name in column_names},
+            strings_can_be_null=False,
+            quoted_strings_can_be_null=False
+        )
+    )
+    for batch in reader:
+        yield from map(list, zip(*(column.to_pylist() for column in batch.columns)))
+
+
+def read_lines(file_path):
+    """
+    Reads a file and returns its raw text lines, without parsing them as CSV.
+
+    Args:
+      file_path (str): The path to the file to be read.
+
+    Returns:
+      list: A list of lines as strings, without line endings.
+
+    Raises:
+      FileNotFoundError: If the specified file does not exist.
+      UnicodeDecodeError: If the file cannot be decoded using UTF-8 encoding.
+    """
+    # Universal newlines turn \r\n and \r into \n; splitlines() would also split on
+    # \x0b, \x0c, \x1c-\x1e, \x85, \u2028 and \u2029 inside a line
+    lines = Path(file_path).read_text(encoding='utf-8').split('\n')
+    if lines[-1] == '':
+        lines.pop()
+    return lines
+
+
+def format_unified_diff(a, b, opcodes, fromfile='', tofile='', lineterm='\n', n=3):
+  """
+  Formats difflib-style opcodes as unified diff lines, grouping them into hunks the same way
+  difflib.unified_diff does.
+
+  Args:
+    a (list): Lines of the first file.
+    b (list): Lines of the second file.
+    opcodes (list): (tag, i1, i2, j1, j2) tuples covering both files, as from SequenceMatcher.get_opcodes.
+    fromfile (str, optional): Header for the first file.
+    tofile (str, optional): Header for the second file.
+    lineterm (str, optional): Line terminator for the header and hunk lines.
+    n (int, optional): Number of context lines around each change.
+
+  Yields:
+    str: The lines of the unified diff.
+  """
+  def format_range(start, stop):
+    length = stop - start
+    if length == 1:
+      return f"{start + 1}"
+    return f"{start + 1 if length else start},{length}"
+
+  # Trim the leading/trailing context and split on long runs of equal lines
+  codes = list(opcodes) or [("equal", 0, 1, 0, 1)]
+  if codes[0][0] == "equal":
+    tag, i1, i2, j1, j2 = codes[0]
+    codes[0] = tag, max(i1, i2 - n), i2, max(j1, j2 - n), j2
+  if codes[-1][0] == "equal":
+    tag, i1, i2, j1, j2 = codes[-1]
+    codes[-1] = tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n)
+
+  groups = []
+  group = []
+  for tag, i1, i2, j1, j2 in codes:
+    if tag == "equal" and i2 - i1 > 2 * n:
+      group.append((tag, i1, min(i2, i1 + n), j1, min(j2, j1 + n)))
+      groups.append(group)
+      group = []
+      i1, j1 = max(i1, i2 - n), max(j1, j2 - n)
+    group.append((tag, i1, i2, j1, j2))
+  if group and not (len(group) == 1 and group[0][0] == "equal"):
+    groups.append(group)
+
+  for index, group in enumerate(groups):
+    if index == 0:
+      yield f"--- {fromfile}{lineterm}"
+      yield f"+++ {tofile}{lineterm}"
+    first, last = group[0], group[-1]
+    yield f"@@ -{format_range(first[1], last[2])} +{format_range(first[3], last[4])} @@{lineterm}"
+    for tag, i1, i2, j1, j2 in group:
+      if tag == "equal":
+        for line in a[i1:i2]:
+          yield " " + line
+        continue
+      if tag in ("replace", "delete"):
+        for line in a[i1:i2]:
+          yield "-" + line
+      if tag in ("replace", "insert"):
+        for line in b[j1:j2]:
+          yield "+" + line
+
+
+def lcs_unified_diff(a, b, fromfile='', tofile='', lineterm='\n', n=3):
+  """
+  Drop-in for difflib.unified_diff that computes the edit script with rapidfuzz's native
+  Indel (longest common subsequence) opcodes instead of SequenceMatcher.
+
+  Indel only inserts and deletes, so unrelated lines are never paired up as replacements and the
+  number of changed lines is the minimum possible.
+
+  Args:
+    a (list): Lines of the first file.
+    b (list): Lines of the second file.
+    fromfile (str, optional): Header for the first file.
+    tofile (str, optional): Header for the second file.
+    lineterm (str, optional): Line terminator for the header and hunk lines.
+    n (int, optional): Number of context lines around each change.
+
+  Returns:
+    generator: The lines of the unified diff.
+  """
+  from rapidfuzz.distance import Indel
+
+  # Merge adjacent inserts/deletes into one block so removed lines print before added ones, as in difflib
+  opcodes = []
+  for op in Indel.opcodes(a, b):
+    if op.tag != "equal" and opcodes and opcodes[-1][0] != "equal":
+      _, i1, _, j1, _ = opcodes[-1]
+      i2, j2 = op.src_end, op.dest_end
+      tag = "replace" if i1 < i2 and j1 < j2 else ("delete" if i1 < i2 else "insert")
+      opcodes[-1] = (tag, i1, i2, j1, j2)
+    else:
+      opcodes.append((op.tag, op.src_start, op.src_end, op.dest_start, op.dest_end))
+  return format_unified_diff(a, b, opcodes, fromfile, tofile, lineterm, n)
+
+
+def load_unified_diff(line_pairs=0):
+  """
+  Picks the best installed unified diff implementation.
+
+  Prefers patience diff, then rapidfuzz's Indel opcodes, then the Rust port of difflib, then the
+  stdlib. rapidfuzz's exact LCS never marks more lines as changed than SequenceMatcher's heuristic
+  matching, but its time and memory grow with len(a) * len(b), so it is skipped above
+  LCS_DIFF_BUDGET line pairs. All of them take the same arguments as difflib.unified_diff. The
+  backends are imported here so entry mode and --help don't pay for them.
+
+  Args:
+    line_pairs (int, optional): len(a) * len(b) of the files about to be diffed.
+
+  Returns:
+    callable: A unified_diff function.
+  """
+  try:
+    from patiencediff import unified_diff
+    return unified_diff
+  except ImportError:
+    pass
+  if line_pairs <= LCS_DIFF_BUDGET and importlib.util.find_spec('rapidfuzz') is not None:
+    return lcs_unified_diff
+  try:
+    from difflib_rs import unified_diff
+  except ImportError:
+    from difflib import unified_diff
+  return unified_diff
 
 
 def literal_diff(file1_lines, file2_lines, file1_path, file2_path):
   """
-  Performs a line-by-line (literal) diff between two CSV files using difflib.
+  Performs a line-by-line (literal) diff between two CSV files as a unified diff.
 
   Args:
-    file1_lines (list): List of rows from the first CSV file.
-    file2_lines (list): List of rows from the second CSV file.
+    file1_lines (list): List of raw text lines from the first CSV file.
+    file2_lines (list): List of raw text lines from the second CSV file.
     file1_path (Path): Path to the first CSV file.
     file2_path (Path): Path to the second CSV file.
 
   Returns:
-    list: List of strings representing the unified diff output.
+    tuple: The unified diff output as a list of strings, and the number of those lines that start with '+' or '-'.
   """
-
-  # Convert CSV rows to strings for difflib
-  file1_strings = [','.join(row) for row in file1_lines]
-  file2_strings = [','.join(row) for row in file2_lines]
+  unified_diff = load_unified_diff(len(file1_lines) * len(file2_lines))
 
   # Get file modification times
   file1_time = datetime.fromtimestamp(file1_path.stat().st_mtime).isoformat()
   file2_time = datetime.fromtimestamp(file2_path.stat().st_mtime).isoformat()
 
-  diff = difflib.unified_diff(
-    file1_strings,
-    file2_strings,
+  diff = unified_diff(
+    file1_lines,
+    file2_lines,
     fromfile=f"a/{file1_path.name}\t{file1_time}",
     tofile=f"b/{file2_path.name}\t{file2_time}",
     lineterm='',
     n=3  # context lines
   )
-  return list(diff)
+  diff = list(diff)
+  # Count the changed lines once here so main doesn't rescan the diff for each summary
+  changed_count = sum(1 for line in diff if line[:1] in ('+', '-'))
+  return diff, changed_count
+
+
+def row_fingerprint(row: list[str]) -> int:
+  """
+  Computes a 64-bit fingerprint of a CSV row for use as a set key.
+
+  Uses xxhash when it is installed, otherwise falls back to a 64-bit blake2b digest.
+  The hashed data starts with the cell count and each cell's length, so rows like [] and [''],
+  or ['x\x1fy'] and ['x', 'y'], encode differently.
+
+  Args:
+    row (list): A row of strings from a CSV file.
+
+  Returns:
+    int: The fingerprint of the row.
+  """
+  lengths = ",".join(map(str, map(len, row)))
+  cells = "\x1f".join(row)
+  data = f"{len(row)}:{lengths}\x1e{cells}".encode('utf-8')
+  if xxhash is not None:
+    return xxhash.xxh3_64_intdigest(data)
+  return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), 'little')
 
 
-def entry_diff(file1_lines, file2_lines, file1_path, file2_path):
+def iter_batches(rows, size=BATCH_SIZE):
+  """
+  Groups an iterable of rows into lists of at most size rows.
+
+  Args:
+    rows (iterable): The rows to group.
+    size (int, optional): The maximum number of rows per batch.
+
+  Yields:
+    list: The next batch of rows.
+  """
+  rows = iter(rows)
+  while batch := list(islice(rows, size)):
+    yield batch
+
+
+def hash_index_locations(file_path):
+  """
+  Lists where the .hashidx fingerprint cache of a CSV file may live, in order of preference:
+  next to the file, then in the user cache directory for files in read-only locations.
+
+  Args:
+    file_path (Path): Path to the CSV file.
+
+  Returns:
+    list: Candidate Paths for the .hashidx file.
+  """
+  cache_dir = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'csv_diff'
+  cache_name = hashlib.sha1(str(Path(file_path).resolve()).encode('utf-8')).hexdigest() + '.hashidx'
+  return [Path(f"{file_path}.hashidx"), cache_dir / cache_name]
+
+
+def read_hash_index(file_path, stat, use_arrow=False):
+  """
+  Loads the cached row fingerprints of a CSV file from the first up to date .hashidx file.
+
+  Args:
+    file_path (Path): Path to the CSV file.
+    stat (os.stat_result): Current stat of the CSV file, used to check the cache is up to date.
+    use_arrow (bool, optional): Whether the file is parsed with pyarrow, which must match the cache.
+
+  Returns:
+    array: array('Q') of fingerprints in file order, or None if no up to date cache exists.
+  """
+  parser = b'arrow' if use_arrow else b'csv'
+  for location in hash_index_locations(file_path):
+    fingerprints = None
+    try:
+      with open(location, 'rb') as f:
+        header = f.read(HASH_INDEX_HEADER.size)
+        if len(header) == HASH_INDEX_HEADER.size:
+          tag, cache_parser, mtime_ns, size, nrows = HASH_INDEX_HEADER.unpack(header)
+          cache_key = (tag.rstrip(b'\0'), cache_parser.rstrip(b'\0'), mtime_ns, size)
+          if cache_key == (FINGERPRINT_TAG, parser, stat.st_mtime_ns, stat.st_size):
+            fingerprints = array('Q')
+            fingerprints.fromfile(f, nrows)
+    except (OSError, EOFError):
+      continue
+    if fingerprints is None:
+      continue
+    if sys.byteorder == 'big':
+      fingerprints.byteswap()
+    return fingerprints
+  return None
+
+
+def write_hash_index(file_path, stat, fingerprints, use_arrow=False):
+  """
+  Writes the row fingerprints of a CSV file to the first writable .hashidx location.
+
+  Failing to write the cache is not an error, the fingerprints are just recomputed next run.
+
+  Args:
+    file_path (Path): Path to the CSV file.
+    stat (os.stat_result): Stat of the CSV file taken before it was read.
+    fingerprints (array): array('Q') of fingerprints in file order.
+    use_arrow (bool, optional): Whether the file was parsed with pyarrow.
+  """
+  data = array('Q', fingerprints)
+  if sys.byteorder == 'big':
+    data.byteswap()
+  parser = b'arrow' if use_arrow else b'csv'
+  header = HASH_INDEX_HEADER.pack(FINGERPRINT_TAG, parser, stat.st_mtime_ns, stat.st_size, len(data))
+  for location in hash_index_locations(file_path):
+    try:
+      location.parent.mkdir(parents=True, exist_ok=True)
+      with open(location, 'wb') as f:
+        f.write(header)
+        data.tofile(f)
+      return
+    except OSError:
+      continue
+
+
+def iter_fingerprinted(file_path, use_hash_index=False, use_arrow=False, known_fingerprints=None):
+  """
+  Streams a CSV file in batches alongside the fingerprint of each row.
+
+  Fingerprints are taken from known_fingerprints when given, or with use_hash_index from the file's
+  .hashidx sidecar when it is up to date. Otherwise they are computed, and with use_hash_index the
+  sidecar is rewritten once the whole file has been read.
+
+  Args:
+    file_path (Path): Path to the CSV file.
+    use_hash_index (bool, optional): Whether to read and write the .hashidx sidecar.
+    use_arrow (bool, optional): Parse the file with pyarrow instead of csv.reader.
+    known_fingerprints (array, optional): array('Q') of this file's fingerprints from an earlier pass.
+
+  Yields:
+    tuple: A batch of rows and the array('Q') of their fingerprints.
+  """
+  stat = Path(file_path).stat()
+  cached = known_fingerprints
+  if cached is None and use_hash_index:
+    cached = read_hash_index(file_path, stat, use_arrow)
+  computed = array('Q')
+  offset = 0
+  file_rows = iter_csv_arrow(file_path) if use_arrow else iter_csv(file_path)
+  for rows in iter_batches(file_rows):
+    if cached is not None:
+      fingerprints = cached[offset:offset + len(rows)]
+    else:
+      fingerprints = array('Q', map(row_fingerprint, rows))
+      if use_hash_index:
+        computed.extend(fingerprints)
+    offset += len(rows)
+    yield rows, fingerprints
+  if use_hash_index and cached is None:
+    write_hash_index(file_path, stat, computed, use_arrow)
+
+
+def file_fingerprints(file_path, use_hash_index=False, use_arrow=False):
+  """
+  Fingerprints every row of a CSV file, skipping the parse entirely when an up to date
+  .hashidx sidecar exists and use_hash_index is set.
+
+  Args:
+    file_path (Path): Path to the CSV file.
+    use_hash_index (bool, optional): Whether to read and write the .hashidx sidecar.
+    use_arrow (bool, optional): Parse the file with pyarrow instead of csv.reader.
+
+  Returns:
+    array: array('Q') of fingerprints in file order.
+  """
+  if use_hash_index:
+    cached = read_hash_index(file_path, Path(file_path).stat(), use_arrow)
+    if cached is not None:
+      return cached
+  fingerprints = array('Q')
+  for _, batch in iter_fingerprinted(file_path, use_hash_index, use_arrow):
+    fingerprints.extend(batch)
+  return fingerprints
+
+
+def load_hash_kernels():
+  """
+  Imports hash_kernels.py from this script's directory, so it is found regardless of sys.path.
+
+  Returns:
+    module: The hash_kernels module.
+  """
+  spec = importlib.util.spec_from_file_location('hash_kernels', Path(__file__).with_name('hash_kernels.py'))
+  module = importlib.util.module_from_spec(spec)
+  spec.loader.exec_module(module)
+  return module
+
+
+def build_fingerprint_index(fingerprints):
+  """
+  Builds a lookup for probing batches of fingerprints against a fixed set.
+
+  Uses the Numba hash-table kernels when numba and numpy are installed, otherwise a Python set.
+
+  Args:
+    fingerprints (array): array('Q') of fingerprints to index.
+
+  Returns:
+    callable: Takes an array('Q') batch and returns a sequence of bools, True where the
+      fingerprint is in the index.
+  """
+  # Any import failure of numpy/numba (including numba's own version checks) means no kernels.
+  # Errors inside hash_kernels.py itself are real and propagate.
+  try:
+    import numpy as np
+    importlib.import_module('numba')
+  except ImportError:
+    index = set(fingerprints)
+    return lambda batch: [fp in index for fp in batch]
+  kernels = load_hash_kernels()
+  table, has_zero = kernels.build_hash_table(np.array(fingerprints, dtype=np.uint64))
+  return lambda batch: kernels.probe_hash_table(table, has_zero, np.array(batch, dtype=np.uint64))
+
+
+def entry_diff(file1_path: Path, file2_path: Path, use_hash_index: bool = False, use_arrow: bool = False) -> dict:
   """
   Performs an entry-wise diff between two CSV files, returning unique and common rows with statistics.
 
+  Both files are streamed instead of being loaded up front. File A is reduced to an index of row
+  fingerprints, File B is probed against that index in batches, and a second pass over File A
+  collects the rows that were never matched, reusing the fingerprints from the first pass. Rows are returned in the order they first appear
+  in their file rather than sorted.
+
   Args:
-    file1_lines (list): List of rows from the first CSV file.
-    file2_lines (list): List of rows from the second CSV file.
     file1_path (Path): Path to the first CSV file.
     file2_path (Path): Path to the second CSV file.
+    use_hash_index (bool, optional): Reuse and update the .hashidx fingerprint sidecars of both files.
+    use_arrow (bool, optional): Parse both files with pyarrow instead of csv.reader.
 
   Returns:
     dict: Contains lists of unique and common rows, and statistics.
   """
-  file1_set = set(tuple(row) for row in file1_lines)
-  file2_set = set(tuple(row) for row in file2_lines)
-
-  only_in_file1 = file1_set - file2_set
-  only_in_file2 = file2_set - file1_set
-  common = file1_set & file2_set
+  file1_fingerprints = file_fingerprints(file1_path, use_hash_index, use_arrow)
+  file1_total = len(file1_fingerprints)
+  in_file1 = build_fingerprint_index(file1_fingerprints)
+
+  # Rows are keyed by fingerprint so duplicates are only reported once
+  file2_total = 0
+  common = {}
+  only_in_file2 = {}
+  for rows, fingerprints in iter_fingerprinted(file2_path, use_hash_index, use_arrow):
+    file2_total += len(rows)
+    for fp, row, found in zip(fingerprints, rows, in_file1(fingerprints)):
+      if found:
+        common[fp] = row
+      else:
+        only_in_file2[fp] = row
+  del in_file1
+
+  only_in_file1 = {}
+  # File A's fingerprints are kept from the first pass, so its rows are only parsed again, not rehashed
+  for rows, fingerprints in iter_fingerprinted(file1_path, use_arrow=use_arrow, known_fingerprints=file1_fingerprints):
+    for fp, row in zip(fingerprints, rows):
+      if fp not in common:
+        only_in_file1[fp] = row
 
   return {
-    "file1_only": [list(row) for row in sorted(only_in_file1)],
-    "file2_only": [list(row) for row in sorted(only_in_file2)],
-    "common": [list(row) for row in sorted(common)],
+    "file1_only": list(only_in_file1.values()),
+    "file2_only": list(only_in_file2.values()),
+    "common": list(common.values()),
     "stats": {
-      "file1_total": len(file1_lines),
-      "file2_total": len(file2_lines),
+      "file1_total": file1_total,
+      "file2_total": file2_total,
       "common_count": len(common),
       "file1_unique": len(only_in_file1),
       "file2_unique": len(only_in_file2)
@@ -159,9 +669,9 @@ def entry_diff(file1_lines, file2_lines, file1_path, file2_path):
   }
 
 
-def generate_diff_report(diff, mode, file1_path, file2_path):
+def write_diff_report(diff: Any, mode: str, file1_path: Path, file2_path: Path, out_file: BinaryIO) -> None:
   """
-  Generates a formatted report summarizing the differences between two CSV files.
+  Writes a formatted report summarizing the differences between two CSV files.
   Args:
     diff (dict or list): The difference data between the two CSV files.
       - If mode is "literal", this should be a list of string differences.
@@ -172,14 +682,22 @@ def generate_diff_report(diff, mode, file1_path, file2_path):
     mode (str): The report mode, either "literal" for line-by-line differences or "entry" for row-based comparison.
     file1_path (Path): Path object for the first CSV file.
     file2_path (Path): Path object for the second CSV file.
-  Returns:
-    str: A multi-line string containing the formatted diff report.
+    out_file (BufferedWriter): Binary file the UTF-8 encoded report is streamed into, one newline-terminated line per entry.
   """
   timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-  report_lines = []
+
+  def add_lines(lines):
+    # Stream lines to the file as they are formatted instead of building the whole report in memory
+    out_file.writelines(f"{line}\n".encode('utf-8') for line in lines)
+
+  def add(*lines):
+    add_lines(lines)
+
+  def add_rows(marker, rows):
+    add_lines(f"{marker} [{i:4d}] {', '.join(row)}" for i, row in enumerate(rows, 1))
 
   # Add header
-  report_lines.extend([
+  add(
     "CSV Diff Report",
     f"Generated: {timestamp}",
     "Tool: CSV Differ by Nathan T. Beene",
@@ -188,19 +706,19 @@ def generate_diff_report(diff, mode, file1_path, file2_path):
     f"File B: {file2_path.absolute()}",
     "=" * 60,
     ""
-  ])
+  )
 
   if mode == "literal":
     if not diff:
-      report_lines.append("No differences found.")
+      add("No differences found.")
     else:
-      report_lines.extend(diff)
+      add_lines(diff)
 
   elif mode == "entry":
     stats = diff.get("stats", {})
 
     # Add statistics section
-    report_lines.extend([
+    add(
       "STATISTICS:",
       f"  File A total rows: {stats.get('file1_total', 0)}",
       f"  File B total rows: {stats.get('file2_total', 0)}",
@@ -210,32 +728,28 @@ def generate_diff_report(diff, mode, file1_path, file2_path):
       "",
       "-" * 60,
       ""
-    ])
+    )
 
     # Rows only in File A
     if diff["file1_only"]:
-      report_lines.extend([
+      add(
         f"ROWS ONLY IN FILE A ({len(diff['file1_only'])} rows):",
         "-" * 40
-      ])
-      for i, entry in enumerate(diff["file1_only"], 1):
-        report_lines.append(f"- [{i:4d}] {', '.join(str(cell) for cell in entry)}")
-      report_lines.append("")
+      )
+      add_rows("-", diff["file1_only"])
+      add("")
 
     # Rows only in File B
     if diff["file2_only"]:
-      report_lines.extend([
+      add(
         f"ROWS ONLY IN FILE B ({len(diff['file2_only'])} rows):",
         "-" * 40
-      ])
-      for i, entry in enumerate(diff["file2_only"], 1):
-        report_lines.append(f"+ [{i:4d}] {', '.join(str(cell) for cell in entry)}")
-      report_lines.append("")
+      )
+      add_rows("+", diff["file2_only"])
+      add("")
 
     if not diff["file1_only"] and not diff["file2_only"]:
-      report_lines.append("No differences found - files are identical.")
-
-  return "\n".join(report_lines)
+      add("No differences found - files are identical.")
 
 def check_file_types(file1, file2):
     """
@@ -294,20 +808,29 @@ def main():
     if args.verbose:
         print("Validating file types...", end="")
     check_file_types(args.file1, args.file2)
+    arrow_errors = ()
+    if args.arrow:
+        try:
+            from pyarrow import ArrowInvalid
+        except ImportError:
+            print("Error: --arrow requires pyarrow to be installed.")
+            sys.exit(1)
+        arrow_errors = (ArrowInvalid,)
     if args.verbose:
         print("done.")
         print()
 
-    # Read CSV files
-    if args.verbose:
-        print("Reading CSV files...", end="")
-    file1_lines = read_csv(args.file1)
-    file2_lines = read_csv(args.file2)
-    if args.verbose:
-        print("done.")
-        print(f"  - File A: {len(file1_lines)} rows")
-        print(f"  - File B: {len(file2_lines)} rows")
-        print()
+    # Read CSV files (entry mode streams them during the comparison instead)
+    if args.mode != "entry":
+        if args.verbose:
+            print("Reading CSV files...", end="")
+        file1_lines = read_lines(args.file1)
+        file2_lines = read_lines(args.file2)
+        if args.verbose:
+            print("done.")
+            print(f"  - File A: {len(file1_lines)} rows")
+            print(f"  - File B: {len(file2_lines)} rows")
+            print()
 
     # Perform comparison
     if args.verbose:
@@ -316,16 +839,23 @@ def main():
         print("Analyzing differences...")
 
     if args.mode == "entry":
-        diff = entry_diff(file1_lines, file2_lines, args.file1, args.file2)
+        try:
+            diff = entry_diff(args.file1, args.file2, use_hash_index=args.hash_index, use_arrow=args.arrow)
+        except arrow_errors as e:
+            print(f"Error: pyarrow could not parse the CSV files: {e}")
+            sys.exit(1)
     elif args.mode == "literal" or not args.mode:
         # Default to literal diff if mode is unknown
-        diff = literal_diff(file1_lines, file2_lines, args.file1, args.file2)
+        diff, diff_count = literal_diff(file1_lines, file2_lines, args.file1, args.file2)
     else:
         print(f"Error: Unknown mode {args.mode}")
         sys.exit(1)
 
     if args.verbose:
         print("done.")
+        if args.mode == "entry":
+            print(f"  - File A: {diff['stats']['file1_total']} rows")
+            print(f"  - File B: {diff['stats']['file2_total']} rows")
         print("--------------------------------------------------")
 
     # Check for differences and provide summary
@@ -346,7 +876,7 @@ def main():
             if diff["file1_only"]:
                 print(f"  Examples from File A only:")
                 for i, row in enumerate(diff["file1_only"][:3], 1):
-                    row_text = ", ".join(str(cell) for cell in row)
+                    row_text = ", ".join(row)
                     if len(row_text) > 150:
                         row_text = row_text[:150] + "..."
                     print(f"    {i}. {row_text}")
@@ -356,7 +886,7 @@ def main():
             if diff["file2_only"]:
                 print(f"  Examples from File B only:")
                 for i, row in enumerate(diff["file2_only"][:3], 1):
-                    row_text = ", ".join(str(cell) for cell in row)
+                    row_text = ", ".join(row)
                     if len(row_text) > 150:
                         row_text = row_text[:150] + "..."
                     print(f"    {i}. {row_text}")
@@ -364,18 +894,17 @@ def main():
                     print(f"    ... and {len(diff['file2_only']) - 3} more")
     else:
         # Literal mode
-        diff_count = len([line for line in diff if line.startswith('+') or line.startswith('-')])
         print(f"Analysis complete: {diff_count} lines differ")
 
         if args.verbose and diff:
             print("  Sample differences:")
             shown = 0
             for line in diff:
-                if (line.startswith('+') or line.startswith('-')) and shown < 5:
+                if line[:1] in ('+', '-') and shown < 5:
                     print(f"    {line[:100]}{'...' if len(line) > 100 else ''}")
                     shown += 1
                 if shown >= 5:
-                    remaining = sum(1 for l in diff if l.startswith('+') or l.startswith('-')) - 5
+                    remaining = diff_count - 5
                     if remaining > 0:
                         print(f"    ... and {remaining} more differences")
                     break
@@ -391,8 +920,8 @@ def main():
 
     if args.output:
         output_file = get_proper_output_path(args.output) / f"diff_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.diff"
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(generate_diff_report(diff, args.mode, args.file1, args.file2))
+        with open(output_file, 'wb', buffering=1 << 20) as f:
+            write_diff_report(diff, args.mode, args.file1, args.file2, f)
         if args.verbose:
             print(f"  Report saved: {output_file.name}")
         else:
@@ -404,8 +933,7 @@ def main():
             total_diff = stats.get('file1_unique', 0) + stats.get('file2_unique', 0)
             print(f"Total differing rows: {total_diff}")
         else:
-            diff_lines = len([line for line in diff if line.startswith('+') or line.startswith('-')])
-            print(f"Total differing lines: {diff_lines}")
+            print(f"Total differing lines: {diff_count}")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,63 @@
+import numpy as np
+from numba import njit
+
+# Numba kernels used by csv_diff.py to probe row fingerprints in entry mode.
+# Kept in their own module so numpy and numba are only imported when entry mode needs them.
+
+@njit(cache=True)
+def build_hash_table(hashes):
+    """
+    Builds an open-addressing (linear probing) hash table from an array of fingerprints.
+
+    Slot value 0 marks an empty slot, so a zero fingerprint is tracked with a separate flag.
+
+    Args:
+      hashes (numpy.ndarray): uint64 array of fingerprints.
+
+    Returns:
+      tuple: The uint64 table and whether a zero fingerprint was inserted.
+    """
+    size = 1
+    while size < 2 * hashes.shape[0]:
+        size <<= 1
+    table = np.zeros(size, dtype=np.uint64)
+    mask = np.uint64(size - 1)
+    has_zero = False
+    for h in hashes:
+        if h == 0:
+            has_zero = True
+            continue
+        i = h & mask
+        while table[i] != 0 and table[i] != h:
+            i = (i + np.uint64(1)) & mask
+        table[i] = h
+    return table, has_zero
+
+
+@njit(cache=True)
+def probe_hash_table(table, has_zero, hashes):
+    """
+    Probes a table built by build_hash_table for each fingerprint in an array.
+
+    Args:
+      table (numpy.ndarray): The uint64 table returned by build_hash_table.
+      has_zero (bool): Whether a zero fingerprint is in the table.
+      hashes (numpy.ndarray): uint64 array of fingerprints to look up.
+
+    Returns:
+      numpy.ndarray: Boolean mask, True where the fingerprint is in the table.
+    """
+    mask = np.uint64(table.shape[0] - 1)
+    found = np.zeros(hashes.shape[0], dtype=np.bool_)
+    for j in range(hashes.shape[0]):
+        h = hashes[j]
+        if h == 0:
+            found[j] = has_zero
+            continue
+        i = h & mask
+        while table[i] != 0:
+            if table[i] == h:
+                found[j] = True
+                break
+            i = (i + np.uint64(1)) & mask
+    return found
@@ -1,9 +1,32 @@
 import os
+import shutil
 import zipfile
 from pathlib import Path
 import argparse
+from typing import Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from tqdm import tqdm
 
+# Use zlib-ng's SIMD DEFLATE and CRC32 for zipfile when it is installed. zipfile
+# binds crc32 at import time, so it has to be replaced separately.
+try:
+    from zlib_ng import zlib_ng
+    zipfile.zlib = zlib_ng  # type: ignore[attr-defined]
+    zipfile.crc32 = zlib_ng.crc32  # type: ignore[attr-defined]
+except ImportError:
+    pass
+
+# Chunk size used when copying files into an archive (ZipFile.write uses 8 KiB)
+COPY_BUFFER_SIZE = 1 << 20
+
+# Extensions of formats that are already compressed, stored as-is instead of deflated
+STORED_EXTENSIONS = {
+    '.zip', '.gz', '.tgz', '.bz2', '.xz', '.7z', '.rar', '.zst',
+    '.jpg', '.jpeg', '.png', '.gif', '.webp',
+    '.mp3', '.mp4', '.m4a', '.mkv', '.mov', '.avi', '.webm',
+    '.docx', '.xlsx', '.pptx', '.jar', '.apk',
+}
+
 #################################
 ###  DIRECTORY ZIPPER TOOL    ###
 ## Created by: aten.dev        ##
@@ -41,7 +64,36 @@ def get_subdirectories(parent_dir):
     return [item for item in parent_dir.iterdir() if item.is_dir()]
 
 
-def count_files_in_directory(directory):
+def iter_files(directory: Path) -> Iterator[tuple[str, str]]:
+    """
+    Walks a directory tree with os.scandir, yielding every file along with its path inside the archive.
+
+    Like os.walk, symlinks to directories are not followed and directories
+    that cannot be listed are skipped.
+
+    Args:
+      directory (Path): The directory to walk.
+
+    Yields:
+      tuple: (path, arcname) strings for each file found.
+    """
+    stack = [(str(directory), '')]
+    while stack:
+        current, prefix = stack.pop()
+        try:
+            entries = os.scandir(current)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir():
+                    if not entry.is_symlink():
+                        stack.append((entry.path, prefix + entry.name + '/'))
+                else:
+                    yield entry.path, prefix + entry.name
+
+
+def count_files_in_directory(directory: Path) -> list[tuple[str, str]]:
     """
     Counts all files within a directory and its subdirectories.
 
@@ -49,16 +101,42 @@ def count_files_in_directory(directory):
       directory (Path): The directory to count files in.
 
     Returns:
-      list: A list of tuples containing (root, file) pairs for all files found.
+      list: A list of (path, arcname) tuples for all files found.
     """
-    all_files = []
-    for root, _, files in os.walk(directory):
-        for file in files:
-            all_files.append((root, file))
-    return all_files
+    return list(iter_files(directory))
 
 
-def zip_directory(directory, output_path, verbose=False):
+def get_compress_type(file_path):
+    """
+    Picks the zip compression method for a file based on its extension.
+
+    Args:
+      file_path (str): The file being added to the archive.
+
+    Returns:
+      int: zipfile.ZIP_STORED for already-compressed formats, zipfile.ZIP_DEFLATED otherwise.
+    """
+    if os.path.splitext(file_path)[1].lower() in STORED_EXTENSIONS:
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+
+def add_file_to_zip(zipf, file_path, arcname):
+    """
+    Adds a single file to an open zip archive, copying it in COPY_BUFFER_SIZE chunks.
+
+    Args:
+      zipf (ZipFile): The archive being written.
+      file_path (str): The file to add.
+      arcname (str): The name of the file inside the archive.
+    """
+    zinfo = zipfile.ZipInfo.from_file(file_path, arcname)
+    zinfo.compress_type = get_compress_type(file_path)
+    with open(file_path, 'rb') as src, zipf.open(zinfo, 'w') as dst:
+        shutil.copyfileobj(src, dst, COPY_BUFFER_SIZE)
+
+
+def zip_directory(directory: Path, output_path: Path, verbose: bool = False) -> bool:
     """
     Zips a single directory to the specified output path.
 
@@ -71,22 +149,20 @@ def zip_directory(directory, output_path, verbose=False):
       bool: True if successful, False otherwise.
     """
     try:
-        all_files = count_files_in_directory(directory)
-
+        # Only list the files up front when verbose output needs the total
         if verbose:
+            all_files = count_files_in_directory(directory)
             print(f"  Zipping {directory.name} ({len(all_files)} files)...")
 
         with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
             if verbose:
                 # Verbose mode with detailed progress
-                for root, file in tqdm(all_files, desc=f"  {directory.name}", unit="file", leave=False):
-                    file_path = Path(root) / file
-                    zipf.write(file_path, file_path.relative_to(directory))
+                for file_path, arcname in tqdm(all_files, desc=f"  {directory.name}", unit="file", leave=False):
+                    add_file_to_zip(zipf, file_path, arcname)
             else:
-                # Non-verbose mode without file-level progress
-                for root, file in all_files:
-                    file_path = Path(root) / file
-                    zipf.write(file_path, file_path.relative_to(directory))
+                # Non-verbose mode compresses files as the walk finds them
+                for file_path, arcname in iter_files(directory):
+                    add_file_to_zip(zipf, file_path, arcname)
 
         if verbose:
             print(f"  Created: {output_path.name}")
@@ -109,7 +185,7 @@ def main():
     - Parses arguments for directory path, output directory, and verbosity.
     - Resolves and validates parent and output directories.
     - Creates output directory if it doesn't exist.
-    - Iterates through all subdirectories and zips them individually.
+    - Zips each subdirectory individually, in parallel across a process pool unless verbose.
     - Provides progress feedback based on verbosity level.
     """
     args = parse_arguments()
@@ -174,13 +250,29 @@ def main():
     success_count = 0
     failed_count = 0
 
-    # Progress bar for directories
-    for item in tqdm(subdirs, desc="Overall progress", unit="dir", disable=args.verbose):
-        zip_filename = output_dir / f"{item.name}.zip"
-        if zip_directory(item, zip_filename, verbose=args.verbose):
-            success_count += 1
-        else:
-            failed_count += 1
+    if args.verbose:
+        # Verbose mode zips one directory at a time so its per-file progress stays readable
+        for item in subdirs:
+            zip_filename = output_dir / f"{item.name}.zip"
+            if zip_directory(item, zip_filename, verbose=True):
+                success_count += 1
+            else:
+                failed_count += 1
+    else:
+        # Each subdirectory is independent, so zip them in parallel. max_workers is left
+        # to the executor, which caps it at 61 on Windows.
+        with ProcessPoolExecutor() as executor:
+            futures = [
+                executor.submit(zip_directory, item, output_dir / f"{item.name}.zip")
+                for item in subdirs
+            ]
+
+            # Progress bar for directories
+            for future in tqdm(as_completed(futures), total=len(futures), desc="Overall progress", unit="dir"):
+                if future.result():
+                    success_count += 1
+                else:
+                    failed_count += 1
 
     # Summary
     if args.verbose: